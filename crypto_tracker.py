@@ -16,11 +16,19 @@ Persistent Browser Session (faster, stable scraping)
 """
 
 import argparse
+import asyncio
+import csv
+import heapq
+import json
 import os
+import queue
+import random
 import time
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 
+import httpx
+import numpy as np
 import pandas as pd
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
@@ -29,9 +37,23 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from webdriver_manager.chrome import ChromeDriverManager
 
 
+CMC_LISTING_URL = "https://api.coinmarketcap.com/data-api/v3/cryptocurrency/listing"
+
+STEALTH_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "application/json",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://coinmarketcap.com/",
+}
+
+
 # ---------- DRIVER SETUP ----------
 def build_driver(headless: bool = True, window_size: str = "1920,1080") -> webdriver.Chrome:
     chrome_options = Options()
@@ -40,33 +62,137 @@ def build_driver(headless: bool = True, window_size: str = "1920,1080") -> webdr
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument(f"--window-size={window_size}")
+    # Don't block on page load at all: navigation returns immediately and the
+    # explicit waits in scrape_top_n gate on the table actually being there.
+    chrome_options.page_load_strategy = "none"
     chrome_prefs = {"profile.managed_default_content_settings.images": 2}
     chrome_options.experimental_options["prefs"] = chrome_prefs
 
     service = Service(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    # Block resources the table scrape never needs (CSS, fonts, analytics).
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd(
+        "Network.setBlockedURLs",
+        {
+            "urls": [
+                "*.png",
+                "*.jpg",
+                "*.svg",
+                "*.woff*",
+                "*.css",
+                "*google-analytics*",
+                "*doubleclick*",
+            ]
+        },
+    )
+
     driver.get("https://coinmarketcap.com/")
     return driver
 
 
+SESSION_FILE = os.path.expanduser("~/.crypto_tracker_session.json")
+
+
+def _save_session(driver: webdriver.Chrome):
+    """Record the live session so the next run can reattach instead of spawning Chrome."""
+    try:
+        with open(SESSION_FILE, "w") as f:
+            json.dump({"session_id": driver.session_id, "url": driver.command_executor._url}, f)
+    except (OSError, AttributeError):
+        pass
+
+
+def _clear_session():
+    try:
+        os.remove(SESSION_FILE)
+    except OSError:
+        pass
+
+
+def _reattach_session() -> Optional[RemoteWebDriver]:
+    """Reconnect to a browser left behind by a previous run, or None if there isn't one."""
+    try:
+        with open(SESSION_FILE) as f:
+            saved = json.load(f)
+        url, sid = saved["url"], saved["session_id"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    # webdriver.Remote always negotiates a brand-new session; stub newSession
+    # out so the saved one is adopted instead.
+    original_execute = RemoteWebDriver.execute
+
+    def _execute(self, command, params=None):
+        if command == "newSession":
+            return {"success": 0, "value": {"sessionId": sid, "capabilities": {}}}
+        return original_execute(self, command, params)
+
+    RemoteWebDriver.execute = _execute
+    try:
+        driver = webdriver.Remote(command_executor=url, options=Options())
+        driver.session_id = sid
+        driver.title  # liveness probe: the old browser may be gone
+    except Exception:
+        # Dead executor URL surfaces as urllib3 connection errors, not just
+        # WebDriverException; any failure here means the session is gone.
+        _clear_session()
+        return None
+    finally:
+        RemoteWebDriver.execute = original_execute
+    return driver
+
+
+def get_driver(headless: bool = True) -> RemoteWebDriver:
+    """Reattach to a previous run's browser if possible, else spawn a fresh one."""
+    driver = _reattach_session()
+    if driver is not None:
+        print("♻️ Reattached to browser session from previous run.")
+        return driver
+    driver = build_driver(headless=headless)
+    _save_session(driver)
+    return driver
+
+
+class DriverPool:
+    """Pool of pre-warmed Chrome drivers so concurrent scrapes pay startup cost once."""
+
+    def __init__(self, size: int = 1, headless: bool = True):
+        self._pool: "queue.Queue[RemoteWebDriver]" = queue.Queue()
+        for i in range(size):
+            # Only the first slot can reattach; the session file tracks one browser.
+            self._pool.put(get_driver(headless=headless) if i == 0 else build_driver(headless=headless))
+
+    def acquire(self, timeout: Optional[float] = None) -> RemoteWebDriver:
+        """Check out a driver; blocks until one is free."""
+        return self._pool.get(timeout=timeout)
+
+    def release(self, driver: RemoteWebDriver):
+        self._pool.put(driver)
+
+    def quit_all(self):
+        while True:
+            try:
+                self._pool.get_nowait().quit()
+            except queue.Empty:
+                break
+        _clear_session()  # the saved browser is gone now
+
+
 # ---------- HELPERS ----------
+_MONEY_STRIP = str.maketrans("", "", "$,— ")
+_PERCENT_STRIP = str.maketrans("", "", "%+, ")
+_SUFFIX_MULT = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+
+
 def parse_money(text: str) -> Optional[float]:
     """Convert '$64,000' or '$1.2B' into float."""
     if not text:
         return None
-    text = text.replace(",", "").replace("$", "").replace("—", "").strip()
-    multiplier = 1
-    if text.endswith("K"):
-        multiplier = 1_000
-        text = text[:-1]
-    elif text.endswith("M"):
-        multiplier = 1_000_000
-        text = text[:-1]
-    elif text.endswith("B"):
-        multiplier = 1_000_000_000
-        text = text[:-1]
-    elif text.endswith("T"):
-        multiplier = 1_000_000_000_000
+    text = text.translate(_MONEY_STRIP)
+    multiplier = _SUFFIX_MULT.get(text[-1:], 1.0)
+    if multiplier != 1.0:
         text = text[:-1]
     try:
         return float(text) * multiplier
@@ -78,107 +204,313 @@ def parse_percent(text: str) -> Optional[float]:
     """Convert '+3.25%' into float."""
     if not text:
         return None
-    text = text.replace("%", "").replace("+", "").replace(",", "").strip()
+    text = text.translate(_PERCENT_STRIP)
     try:
         return float(text)
     except ValueError:
         return None
 
 
+def parse_money_series(s: pd.Series) -> pd.Series:
+    """Vectorized parse_money: convert a column of '$64,000' / '$1.2B' strings in one pass."""
+    s = s.fillna("").str.strip()
+    mult = s.str[-1:].map({"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}).fillna(1.0)
+    nums = s.str.rstrip("KMBT").str.replace(r"[$,—\s]", "", regex=True)
+    return pd.to_numeric(nums, errors="coerce") * mult
+
+
+def parse_percent_series(s: pd.Series) -> pd.Series:
+    """Vectorized parse_percent: convert a column of '+3.25%' strings in one pass."""
+    nums = s.fillna("").str.replace(r"[%+,\s]", "", regex=True)
+    return pd.to_numeric(nums, errors="coerce")
+
+
+# ---------- CACHE ----------
+_CACHE: Dict[str, tuple] = {}  # key -> (expires_at, records)
+cache_stats = {"hits": 0, "misses": 0}
+
+
+async def get_cached(key: str, fetch_fn, ttl: float) -> List[Dict]:
+    """Return cached records for key, calling fetch_fn only when the entry is older than ttl."""
+    now = time.monotonic()
+    entry = _CACHE.get(key)
+    if entry and entry[0] > now:
+        cache_stats["hits"] += 1
+        return entry[1]
+    cache_stats["misses"] += 1
+    records = fetch_fn()
+    if asyncio.iscoroutine(records):
+        records = await records
+    if records:
+        _CACHE[key] = (now + ttl, records)
+    return records
+
+
 # ---------- SCRAPER ----------
+async def fetch_all(client: httpx.AsyncClient, urls: List[str]) -> List[httpx.Response]:
+    """GET several endpoints concurrently; wall-time is the slowest request, not the sum."""
+    return list(await asyncio.gather(*(client.get(url) for url in urls)))
+
+
+async def fetch_top_n_http(n: int = 10, client: Optional[httpx.AsyncClient] = None) -> List[Dict]:
+    """Fetch top N cryptocurrencies from CoinMarketCap's JSON API (no browser needed)."""
+    try:
+        (resp,) = await fetch_all(client, [f"{CMC_LISTING_URL}?start=1&limit={n}"])
+        resp.raise_for_status()
+        coins = resp.json()["data"]["cryptoCurrencyList"]
+    except (httpx.HTTPError, KeyError, ValueError) as e:
+        print(f"⚠️ API fetch failed: {e}")
+        return []
+
+    return _records_from_coins(coins, n)
+
+
+def _records_from_coins(coins: List[Dict], n: int) -> List[Dict]:
+    """Map CoinMarketCap coin objects (API or page hydration JSON) into record dicts."""
+    records = []
+    for i, coin in enumerate(coins[:n]):
+        try:
+            quote = coin["quotes"][0]
+            rec = {
+                "rank": str(coin.get("cmcRank", i + 1)),
+                "name": coin["name"],
+                "symbol": coin["symbol"],
+                "price": quote["price"],
+                "change_24h": quote["percentChange24h"],
+                "market_cap": quote["marketCap"],
+            }
+            records.append(rec)
+        except (KeyError, IndexError) as e:
+            print(f"⚠️ Failed to parse coin {i}: {e}")
+    return records
+
+
+REFRESH_EVERY_SECS = 300  # full page reload cadence; between reloads we re-read the loaded page
+
+# Selector tuples built once instead of per wait call.
+_SEL_ROWS = (By.CSS_SELECTOR, "table tbody tr")
+_SEL_PRICE_CELL = (By.CSS_SELECTOR, "table tbody tr td:nth-child(4)")
+
+
 def scrape_top_n(driver: webdriver.Chrome, n: int = 10, timeout: int = 30) -> List[Dict]:
     """Scrape top N cryptocurrencies from CoinMarketCap."""
     wait = WebDriverWait(driver, timeout)
     try:
-        driver.refresh()
-        driver.execute_script("window.scrollTo(0, 600);")
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
-        wait.until(
-            EC.text_to_be_present_in_element(
-                (By.CSS_SELECTOR, "table tbody tr td:nth-child(4)"), "$"
-            )
-        )
+        now = time.monotonic()
+        if now - getattr(driver, "_last_refresh", 0.0) >= REFRESH_EVERY_SECS:
+            driver.refresh()
+            driver.execute_script("window.scrollTo(0, 600);")
+            driver._last_refresh = now
+        wait.until(EC.presence_of_element_located(_SEL_ROWS))
     except TimeoutException:
         driver.save_screenshot("debug_timeout.png")
         print("⚠️ Timeout: Table not loaded. Screenshot saved as debug_timeout.png")
         return []
 
-    rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+    # One JS round-trip for the page's hydration JSON beats walking the table
+    # cell by cell over the WebDriver protocol.
+    try:
+        data = driver.execute_script(
+            "return JSON.parse(document.getElementById('__NEXT_DATA__').textContent)"
+        )
+        coins = data["props"]["initialState"]["cryptocurrency"]["listingLatest"]["data"]
+    except (WebDriverException, KeyError, TypeError):
+        return _scrape_table_dom(driver, n, timeout)
+    return _records_from_coins(coins, n)
+
+
+def _scrape_table_dom(driver: webdriver.Chrome, n: int, timeout: int) -> List[Dict]:
+    """Fallback: walk the rendered table when the hydration JSON is unavailable."""
+    wait = WebDriverWait(driver, timeout)
+    try:
+        wait.until(EC.text_to_be_present_in_element(_SEL_PRICE_CELL, "$"))
+    except TimeoutException:
+        print("⚠️ Timeout: Table cells never populated.")
+        return []
+
+    # One JS call returns every cell's text at once; the old per-row
+    # find_elements loop cost a WebDriver round-trip per row per column.
+    rows = driver.execute_script(
+        "return Array.from(document.querySelectorAll('table tbody tr'))"
+        ".slice(0, arguments[0])"
+        ".map(r => Array.from(r.querySelectorAll('td')).map(td => td.innerText))",
+        n,
+    )
     records = []
-    for i, row in enumerate(rows[:n]):
+    for i, cols in enumerate(rows):
         try:
-            cols = row.find_elements(By.TAG_NAME, "td")
             if len(cols) < 8:
                 continue
-            raw_name = cols[2].text.strip().split("\n")
+            raw_name = cols[2].strip().split("\n")
             name = raw_name[0]
             symbol = raw_name[1] if len(raw_name) > 1 else ""
-            price = cols[3].text.strip()
-            change_24h = cols[4].text.strip()
-            market_cap = cols[7].text.strip()
 
+            # Keep the cell text raw here; the numeric columns are parsed
+            # in bulk below instead of one Python call per cell.
             rec = {
-                "rank": cols[1].text.strip(),
+                "rank": cols[1].strip(),
                 "name": name,
                 "symbol": symbol,
-                "price": parse_money(price),
-                "change_24h": parse_percent(change_24h),
-                "market_cap": parse_money(market_cap),
+                "price": cols[3].strip(),
+                "change_24h": cols[4].strip(),
+                "market_cap": cols[7].strip(),
             }
             records.append(rec)
         except Exception as e:
             print(f"⚠️ Failed to parse row {i}: {e}")
-    return records
+
+    if not records:
+        return records
+    df = pd.DataFrame(records)
+    df["price"] = parse_money_series(df["price"])
+    df["change_24h"] = parse_percent_series(df["change_24h"])
+    df["market_cap"] = parse_money_series(df["market_cap"])
+    # Unparseable cells ('—' placeholders) come back as NaN; restore the None
+    # sentinel the rest of the pipeline guards against.
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict("records")
 
 
 # ---------- DATA UTILITIES ----------
-def save_to_csv(records: List[Dict], output_file: str):
-    """Append scraped data to CSV with timestamp."""
+CSV_FIELDS = ["rank", "name", "symbol", "price", "change_24h", "market_cap", "timestamp_utc"]
+
+
+def open_csv_writer(output_file: str):
+    """Open the output CSV once for appending; the header is written only if the file is empty."""
+    needs_header = not os.path.exists(output_file) or os.path.getsize(output_file) == 0
+    f = open(output_file, "a", newline="", buffering=1)
+    writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+    if needs_header:
+        writer.writeheader()
+    return f, writer
+
+
+def save_to_csv(records: List[Dict], writer: csv.DictWriter, ts_iso: str):
+    """Append scraped data to the already-open CSV writer, stamped with the caller's timestamp."""
     if not records:
         return
-    df = pd.DataFrame(records)
-    df["timestamp_utc"] = datetime.now(timezone.utc).isoformat()
-    header = not os.path.exists(output_file)
-    df.to_csv(output_file, mode="a", header=header, index=False)
+    writer.writerows({**r, "timestamp_utc": ts_iso} for r in records)
+
+
+class RecordBuffer:
+    """Accumulate records in memory and flush them to date-partitioned Parquet in batches."""
+
+    def __init__(self, root_path: str, flush_rows: int = 100, flush_secs: float = 300.0):
+        self.root_path = root_path
+        self.flush_rows = flush_rows
+        self.flush_secs = flush_secs
+        self._buf: List[Dict] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, records: List[Dict], ts_iso: str):
+        if not records:
+            return
+        self._buf.extend({**r, "timestamp_utc": ts_iso, "date": ts_iso[:10]} for r in records)
+        if len(self._buf) >= self.flush_rows or time.monotonic() - self._last_flush >= self.flush_secs:
+            self.flush()
+
+    def flush(self):
+        if not self._buf:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_to_dataset(
+            pa.Table.from_pylist(self._buf),
+            root_path=self.root_path,
+            partition_cols=["date"],
+        )
+        self._buf.clear()
+        self._last_flush = time.monotonic()
 
 
-def filter_top_gainers(df: pd.DataFrame, top_k: int = 5):
-    return df.sort_values(by="change_24h", ascending=False).head(top_k)
+def print_snapshot(records: List[Dict]):
+    """Pretty-print the latest records without materializing a DataFrame."""
+    print(f"{'#':>4}  {'Name':<24}{'Symbol':<8}{'Price':>16}{'24h %':>9}{'Market Cap':>20}")
+    for r in records:
+        price = f"{r['price']:,.2f}" if r["price"] is not None else "—"
+        change = f"{r['change_24h']:+.2f}" if r["change_24h"] is not None else "—"
+        mcap = f"{r['market_cap']:,.0f}" if r["market_cap"] is not None else "—"
+        print(f"{r['rank']:>4}  {r['name']:<24}{r['symbol']:<8}{price:>16}{change:>9}{mcap:>20}")
 
 
-def filter_top_losers(df: pd.DataFrame, top_k: int = 5):
-    return df.sort_values(by="change_24h", ascending=True).head(top_k)
+def top_movers(records: List[Dict], k_gain: int = 5, k_loss: int = 5):
+    """Return (top gainers, top losers) straight from the record list via size-K heaps."""
+    keyed = [r for r in records if r["change_24h"] is not None]
+    key = lambda r: r["change_24h"]
+    return heapq.nlargest(k_gain, keyed, key=key), heapq.nsmallest(k_loss, keyed, key=key)
 
 
 def filter_by_price(df: pd.DataFrame, min_price: Optional[float] = None, max_price: Optional[float] = None):
+    """Filter rows by price range with one combined mask and one indexing op."""
+    p = df["price"].to_numpy()
+    mask = np.ones(len(p), dtype=bool)
     if min_price is not None:
-        df = df[df["price"] >= min_price]
+        mask &= p >= min_price
     if max_price is not None:
-        df = df[df["price"] <= max_price]
-    return df
+        mask &= p <= max_price
+    return df.iloc[mask]
 
 
 # ---------- MAIN LOOP ----------
-def main(args):
-    driver = None
+MAX_BACKOFF_SECS = 300  # cap for exponential backoff on failed scrapes
+CIRCUIT_OPEN_THRESHOLD = 5  # consecutive failures before pausing entirely
+CIRCUIT_COOLDOWN_SECS = 600  # how long to pause once the circuit opens
+
+
+def scrape_with_pool(pool: DriverPool, n: int, timeout: int) -> List[Dict]:
+    """Check a driver out of the pool for one scrape, returning it afterwards."""
+    driver = pool.acquire()
     try:
-        driver = build_driver(headless=args.headless)
-        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Browser ready. Starting continuous tracking...")
+        return scrape_top_n(driver, n=n, timeout=timeout)
+    finally:
+        pool.release(driver)
+
 
+async def run_tracker(args):
+    pool = None
+    client = None
+    csv_file = None
+    buffer = None
+    try:
+        if args.format == "parquet":
+            buffer = RecordBuffer(args.output)
+        else:
+            csv_file, writer = open_csv_writer(args.output)
+        if args.use_selenium:
+            pool = DriverPool(size=args.pool_size, headless=args.headless)
+            print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Browser pool ready ({args.pool_size} driver(s)). Starting continuous tracking...")
+        else:
+            client = httpx.AsyncClient(http2=True, headers=STEALTH_HEADERS, timeout=args.timeout)
+            print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] HTTP client ready. Starting continuous tracking...")
+
+        next_t = time.monotonic()
+        fail_streak = 0
         while True:
+            records = []
             try:
-                records = scrape_top_n(driver, n=args.topn, timeout=args.timeout)
+                if args.use_selenium:
+                    fetch = lambda: scrape_with_pool(pool, n=args.topn, timeout=args.timeout)
+                else:
+                    fetch = lambda: fetch_top_n_http(n=args.topn, client=client)
+                records = await get_cached(f"top:{args.topn}", fetch, ttl=args.interval)
                 if not records:
                     print("⚠️ No data found this cycle.")
                 else:
-                    save_to_csv(records, args.output)
-                    df = pd.DataFrame(records)
-
+                    # One timestamp per cycle: the whole batch shares it, and
+                    # the sinks stay pure data functions.
+                    ts_iso = datetime.now(timezone.utc).isoformat()
+                    if buffer is not None:
+                        buffer.add(records, ts_iso)
+                    else:
+                        save_to_csv(records, writer, ts_iso)
                     print("\n✅ Latest Market Snapshot:")
-                    print(df[["rank", "name", "symbol", "price", "change_24h", "market_cap"]].to_string(index=False))
+                    print_snapshot(records)
 
                     # ---- Filters ----
+                    # Only the price filter needs a DataFrame; skip the build otherwise.
                     if args.min_price or args.max_price:
+                        df = pd.DataFrame(records)
                         df_filtered = filter_by_price(df, args.min_price, args.max_price)
                         if not df_filtered.empty:
                             print("\n💰 Coins Matching Price Filter:")
@@ -186,40 +518,78 @@ def main(args):
                         else:
                             print("\n💰 No coins matched the price filter.")
 
-                    if args.show_gainers:
-                        gainers = filter_top_gainers(df, args.show_gainers)
-                        print(f"\n🚀 Top {args.show_gainers} Gainers:")
-                        print(gainers[["name", "symbol", "change_24h"]].to_string(index=False))
-
-                    if args.show_losers:
-                        losers = filter_top_losers(df, args.show_losers)
-                        print(f"\n📉 Top {args.show_losers} Losers:")
-                        print(losers[["name", "symbol", "change_24h"]].to_string(index=False))
+                    if args.show_gainers or args.show_losers:
+                        gainers, losers = top_movers(records, args.show_gainers, args.show_losers)
+                        if args.show_gainers:
+                            print(f"\n🚀 Top {args.show_gainers} Gainers:")
+                            for r in gainers:
+                                print(f"  {r['name']} ({r['symbol']}): {r['change_24h']:+.2f}%")
+                        if args.show_losers:
+                            print(f"\n📉 Top {args.show_losers} Losers:")
+                            for r in losers:
+                                print(f"  {r['name']} ({r['symbol']}): {r['change_24h']:+.2f}%")
 
             except Exception as e:
                 print("Error during scrape:", e)
 
-            print(f"\n⏳ Waiting {args.interval} seconds before next scrape...\n")
-            try:
-                time.sleep(args.interval)
-            except KeyboardInterrupt:
-                print("\n🛑 Auto-tracking stopped by user.")
-                break
+            print(f"\n📦 Cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses")
+
+            # Back off on failures instead of hammering a broken or
+            # rate-limiting site at full cadence.
+            if records:
+                fail_streak = 0
+            else:
+                fail_streak += 1
+                if fail_streak >= CIRCUIT_OPEN_THRESHOLD:
+                    print(f"🔌 {fail_streak} consecutive failures; pausing scrapes for {CIRCUIT_COOLDOWN_SECS} seconds.\n")
+                    await asyncio.sleep(CIRCUIT_COOLDOWN_SECS)
+                else:
+                    backoff = min(MAX_BACKOFF_SECS, args.interval * 2 ** fail_streak) + random.uniform(0, 1)
+                    print(f"⚠️ Scrape failed ({fail_streak} in a row); backing off {backoff:.1f} seconds.\n")
+                    await asyncio.sleep(backoff)
+                next_t = time.monotonic()
+                continue
+
+            # Schedule against a fixed deadline so cadence stays constant no
+            # matter how long the scrape itself took.
+            next_t += args.interval
+            sleep_for = next_t - time.monotonic()
+            if sleep_for > 0:
+                print(f"⏳ Next scrape in {sleep_for:.1f} seconds...\n")
+                await asyncio.sleep(sleep_for)
+            else:
+                print("⏳ Scrape overran the interval; starting next cycle immediately.\n")
 
     except WebDriverException as e:
         print("WebDriver error:", e)
     finally:
-        if driver:
-            driver.quit()
-            print("Browser closed.")
+        if buffer is not None:
+            buffer.flush()
+        if csv_file:
+            csv_file.close()
+        if client:
+            await client.aclose()
+        if pool:
+            pool.quit_all()
+            print("Browsers closed.")
+
+
+def main(args):
+    try:
+        asyncio.run(run_tracker(args))
+    except KeyboardInterrupt:
+        print("\n🛑 Auto-tracking stopped by user.")
 
 
 # ---------- CLI ----------
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Full Cryptocurrency Price Tracker (All Features, Seconds Interval)")
+    parser.add_argument("--use-selenium", action="store_true", help="Scrape with a Chrome browser instead of the JSON API")
     parser.add_argument("--headless", action="store_true", help="Run Chrome in headless mode")
+    parser.add_argument("--pool-size", type=int, default=1, help="Number of pooled Chrome drivers (Selenium mode)")
     parser.add_argument("--topn", type=int, default=10, help="Number of top coins to scrape")
-    parser.add_argument("--output", type=str, default="crypto_prices.csv", help="CSV output file")
+    parser.add_argument("--output", type=str, default="crypto_prices.csv", help="Output file (CSV) or dataset directory (Parquet)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="Output format")
     parser.add_argument("--timeout", type=int, default=30, help="Page load timeout (seconds)")
     parser.add_argument("--interval", type=int, default=10, help="Seconds between scrapes")
     parser.add_argument("--show-gainers", type=int, default=5, help="Show top K gainers each run")